@@ -11,8 +11,6 @@
 """Angle Encoder"""
 from __future__ import annotations
 
-import math
-
 from qiskit.circuit import QuantumCircuit
 
 from piqture.embeddings.image_embedding import ImageEmbedding
@@ -26,7 +24,7 @@ class AngleEncoding(ImageEmbedding):
     def __init__(self, img_dims: tuple[int, ...], pixel_vals: list[list] = None):
         ImageEmbedding.__init__(self, img_dims, pixel_vals)
 
-        self.feature_dims = int(math.prod(self.img_dims))
+        self.feature_dims = self._num_pixels
         self._circuit = QuantumCircuit(self.feature_dims)
         self.q_reg = self._circuit.qubits
 
@@ -35,14 +35,10 @@ class ImageEmbedding(ABC):
         pixel_vals: list[list] = None,
         color_channels: int = 1,
     ):
-        if (
-            not all((isinstance(dims, int) for dims in img_dims))
-            or all((isinstance(dims, bool) for dims in img_dims))
-            or not isinstance(img_dims, tuple)
-        ):
-            raise TypeError("Input img_dims must be of the type tuple[int, ...].")
+        self.validate_image_dims_type(img_dims)
         self.validate_image_dimensions(img_dims)
         self.img_dims = img_dims
+        self._num_pixels = math.prod(img_dims)
 
         self.color_channels = color_channels
         if pixel_vals:
@@ -63,7 +59,7 @@ class ImageEmbedding(ABC):
             self.pixel_vals = pixel_vals
             self._parameters = self.pixel_vals.flatten()
         else:
-            self.pixel_vals = ParameterVector("Parameter", math.prod(img_dims))
+            self.pixel_vals = ParameterVector("Parameter", self._num_pixels)
             self._parameters = self.pixel_vals
 
     @property
@@ -71,6 +67,21 @@ class ImageEmbedding(ABC):
         """Returns parameters in an embedding circuit."""
         return self._parameters
 
+    @staticmethod
+    def validate_image_dims_type(img_dims):
+        """
+        Validates the type of img_dims input.
+
+        The tuple check runs first, so that other containers
+        are rejected without iterating over them.
+        """
+        if (
+            not isinstance(img_dims, tuple)
+            or not all(isinstance(dims, int) for dims in img_dims)
+            or all(isinstance(dims, bool) for dims in img_dims)
+        ):
+            raise TypeError("Input img_dims must be of the type tuple[int, ...].")
+
     def validate_image_dimensions(self, img_dims):
         """
         Validates img_dims input.
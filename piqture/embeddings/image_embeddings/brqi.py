@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import math
 from typing import Union
 
 import numpy as np
@@ -30,7 +29,7 @@ class BRQI(ImageEmbedding, ImageMixin):
 
         ImageEmbedding.__init__(self, img_dims, pixel_vals)
         self.color_qubits = int(np.ceil(np.log2(self.max_color_intensity + 1)))
-        self.feature_dim = int(np.ceil(np.log2(math.prod(self.img_dims))))
+        self.feature_dim = int(np.ceil(np.log2(self._num_pixels)))
 
         # Initialize the _circuit attribute
         self._circuit = QuantumCircuit(self.feature_dim + self.color_qubits)
@@ -109,11 +108,9 @@ class BRQI(ImageEmbedding, ImageMixin):
             representation.
         """
         self.pixel_vals = np.array(self.pixel_vals).flatten()
-        for i in range(self.feature_dim):
-            self.circuit.h(i)
+        self.circuit.h(list(range(self.feature_dim)))
 
-        num_pixels = math.prod(self.img_dims)
-        for pixel in range(num_pixels):
+        for pixel in range(self._num_pixels):
             color_byte = f"{int(self.pixel_vals[pixel]):0>{self.color_qubits}b}"
             self.pixel_value(color_byte=color_byte)
 
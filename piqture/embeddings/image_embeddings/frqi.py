@@ -12,8 +12,6 @@
 
 from __future__ import annotations
 
-import math
-
 import numpy as np
 from qiskit.circuit import QuantumCircuit
 
@@ -30,7 +28,7 @@ class FRQI(ImageEmbedding, ImageMixin):
         ImageEmbedding.__init__(self, img_dims, pixel_vals)
 
         # feature_dim = no. of qubits for pixel position embedding
-        self.feature_dim = int(np.sqrt(math.prod(self.img_dims)))
+        self.feature_dim = int(np.sqrt(self._num_pixels))
 
         # FRQI circuit
         self._circuit = QuantumCircuit(self.feature_dim + 1)
@@ -76,12 +74,10 @@ class FRQI(ImageEmbedding, ImageMixin):
             QuantumCircuit: final circuit with the frqi image
             representation.
         """
-        for i in range(self.feature_dim):
-            self.circuit.h(i)
+        self.circuit.h(list(range(self.feature_dim)))
 
         # Supports grayscale images only.
-        num_theta = math.prod(self.img_dims)
-        for pixel in range(num_theta):
+        for pixel in range(self._num_pixels):
             pixel_pos_binary = f"{pixel:0>2b}"
 
             # Embed pixel position on qubits
@@ -15,6 +15,7 @@ from __future__ import annotations
 import math
 
 from qiskit.circuit import QuantumCircuit
+from qiskit.circuit.library import MCXGate
 
 from piqture.embeddings.image_embeddings.neqr import NEQR
 
@@ -46,6 +47,7 @@ class INEQR(NEQR):
         self.x_coord = int(math.log(img_dims[0], 2))
         self.y_coord = int(math.log(img_dims[1], 2))
         self.feature_dim = self.x_coord + self.y_coord
+        self._mcx_gate = MCXGate(num_ctrl_qubits=self.feature_dim)
 
         # INEQR circuit
         self._circuit = QuantumCircuit(self.feature_dim + self.color_qubits)
@@ -97,21 +99,21 @@ class INEQR(NEQR):
             QuantumCircuit: final circuit with the INEQR image
             representation.
         """
-        for i in range(self.feature_dim):
-            self.circuit.h(i)
+        self.circuit.h(list(range(self.feature_dim)))
 
+        pixel_pos = 0
         for y_index, y_val in enumerate(self.pixel_vals[0]):
-            for x_index, x_val in enumerate(y_val):
+            for x_index, _ in enumerate(y_val):
                 pixel_pos_binary = (
                     f"{y_index:0>{self.y_coord}b}{x_index:0>{self.x_coord}b}"
                 )
-                color_byte = f"{x_val:0>8b}"
 
                 # Embed pixel position on qubits
                 self.pixel_position(pixel_pos_binary)
                 # Embed color information on qubits
-                self.pixel_value(color_byte=color_byte)
+                self.pixel_value(pixel_pos=pixel_pos)
                 # Remove pixel position embedding
                 self.pixel_position(pixel_pos_binary)
+                pixel_pos += 1
 
         return self.circuit
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import math
-
 import numpy as np
 from qiskit.circuit import QuantumCircuit
 from qiskit.circuit.library import MCMT, RYGate
@@ -29,7 +27,7 @@ class MCRQI(ImageEmbedding):
     def __init__(self, img_dims: tuple[int, int], pixel_vals: list[list] = None):
         ImageEmbedding.__init__(self, img_dims, pixel_vals, color_channels=4)
 
-        self.feature_dim = int(np.ceil(np.sqrt(math.prod(self.img_dims))))
+        self.feature_dim = int(np.ceil(np.sqrt(self._num_pixels)))
         # No. of qubits for RGB-alpha color channels
         self.color_channels = 1
         # No. of qubits for RGB-alpha color index
@@ -76,8 +74,7 @@ class MCRQI(ImageEmbedding):
             QuantumCircuit: final circuit with the MCRQI image
             representation.
         """
-        for i in range(self.feature_dim + self.channel_index_qubits):
-            self.circuit.h(i)
+        self.circuit.h(list(range(self.feature_dim + self.channel_index_qubits)))
 
         for channel, channel_pixels in enumerate(self.pixel_vals):
             for pixel_pos, pixel in enumerate(channel_pixels):
@@ -12,16 +12,16 @@
 
 from __future__ import annotations
 
-import math
-
 import numpy as np
-from qiskit.circuit import QuantumCircuit
+from qiskit.circuit import CircuitInstruction, QuantumCircuit
+from qiskit.circuit.library import MCXGate, XGate
 
 from piqture.embeddings.image_embedding import ImageEmbedding
 from piqture.mixin.image_embedding_mixin import ImageMixin
+from piqture.mixin.simulator_input_mixin import SimulatorInputMixin
 
 
-class NEQR(ImageEmbedding, ImageMixin):
+class NEQR(ImageEmbedding, ImageMixin, SimulatorInputMixin):
     """Represents images in NEQR representation format."""
 
     def __init__(
@@ -37,11 +37,39 @@ class NEQR(ImageEmbedding, ImageMixin):
                 "Maximum color intensity cannot be less than 0 or greater than 255."
             )
 
-        self.feature_dim = int(np.ceil(np.sqrt(math.prod(self.img_dims))))
+        # Integer ceil(log2(.)) avoids floating-point rounding at exact
+        # powers, and gives every pixel a distinct position register.
+        self.feature_dim = max(1, (self._num_pixels - 1).bit_length())
         self.max_color_intensity = max_color_intensity + 1
 
         # number of qubits to encode color byte
-        self.color_qubits = int(np.ceil(math.log(self.max_color_intensity, 2)))
+        self.color_qubits = max(1, (self.max_color_intensity - 1).bit_length())
+
+        # Pixel values only decide which MCX gates are placed,
+        # so they can never be symbolic Parameters.
+        if not isinstance(self.pixel_vals, np.ndarray):
+            raise TypeError(
+                f"{self.__class__.__name__} requires numeric pixel_vals "
+                f"of the type list[list]."
+            )
+
+        if self.pixel_vals.size and self.pixel_vals.max() > max_color_intensity:
+            raise ValueError(
+                f"Pixel values cannot be greater than the maximum "
+                f"color intensity {max_color_intensity}."
+            )
+
+        # Flattened, contiguous color bytes of every pixel.
+        pixel_u8 = np.ascontiguousarray(self.pixel_vals.reshape(-1), dtype=np.uint8)
+
+        # color bits of every pixel (MSB first), one row per pixel
+        self._bit_matrix = np.unpackbits(pixel_u8.reshape(-1, 1), axis=1)[
+            :, 8 - self.color_qubits :
+        ]
+
+        # MCX gate shared by every pixel, its decomposition
+        # is left to transpilation.
+        self._mcx_gate = MCXGate(num_ctrl_qubits=self.feature_dim)
 
         # NEQR circuit
         self._circuit = QuantumCircuit(self.feature_dim + self.color_qubits)
@@ -56,41 +84,86 @@ class NEQR(ImageEmbedding, ImageMixin):
         """Embeds pixel position values in a circuit."""
         ImageMixin.pixel_position(self.circuit, pixel_pos_binary)
 
+    def _instruction_plan(self) -> np.ndarray:
+        """
+        Plans the position and color gates of the NEQR circuit
+        with vectorized NumPy operations.
+
+        Pixels are visited in Gray-code order and the position
+        embedding (X on every 0 bit) is updated differentially:
+        only the bits that differ from the previous pixel are flipped.
+        The per-pixel MCX sweeps commute, so the order is immaterial.
+
+        Returns:
+            np.ndarray: sequence of target qubit indices. Indices below
+            feature_dim stand for an X gate on that position qubit, the
+            others for an MCX gate controlled by all position qubits.
+        """
+        num_pixels = self._num_pixels
+        index = np.arange(1 << (num_pixels - 1).bit_length())
+        gray_code = index ^ (index >> 1)
+        gray_code = gray_code[gray_code < num_pixels]
+
+        # Position bits of every visited pixel, qubit 0 holds the MSB.
+        shifts = np.arange(self.feature_dim - 1, -1, -1)
+        position_bits = ((gray_code[:, None] >> shifts) & 1).astype(bool)
+
+        # Flip every 0 bit for the first pixel, then only the changed bits,
+        # and finally undo the flips of the last pixel.
+        flips = np.empty((len(gray_code) + 1, self.feature_dim), dtype=bool)
+        flips[0] = ~position_bits[0]
+        flips[1:-1] = position_bits[1:] ^ position_bits[:-1]
+        flips[-1] = ~position_bits[-1]
+
+        colors = np.zeros((len(gray_code) + 1, self.color_qubits), dtype=bool)
+        colors[:-1] = self._bit_matrix[gray_code]
+
+        steps = np.hstack((flips, colors))
+        return np.flatnonzero(steps) % steps.shape[1]
+
     def pixel_value(self, *args, **kwargs):
         """
         Embeds pixel (color) values in a circuit
         """
-        color_byte = kwargs.get("color_byte")
+        pixel_pos = kwargs.get("pixel_pos")
         control_qubits = list(range(self.feature_dim))
-        for index, color in enumerate(color_byte):
-            if color == "1":
-                self.circuit.mcx(
-                    control_qubits=control_qubits, target_qubit=self.feature_dim + index
-                )
+
+        circuit = self.circuit
+        for index in np.flatnonzero(self._bit_matrix[pixel_pos]).tolist():
+            circuit.append(self._mcx_gate, [*control_qubits, self.feature_dim + index])
 
     def neqr(self) -> QuantumCircuit:
         # pylint: disable=duplicate-code
         """
         Builds the NEQR image representation on a circuit.
+        Use `to_simulator_input` to unroll it for a simulator
+        without Qiskit's optimization passes.
 
         Returns:
             QuantumCircuit: final circuit with the frqi image
             representation.
         """
-        self.pixel_vals = self.pixel_vals.flatten()
-        for i in range(self.feature_dim):
-            self.circuit.h(i)
-
-        num_theta = math.prod(self.img_dims)
-        for pixel in range(num_theta):
-            pixel_pos_binary = f"{pixel:0>2b}"
-            color_byte = f"{int(self.pixel_vals[pixel]):0>8b}"
-
-            # Embed pixel position on qubits
-            self.pixel_position(pixel_pos_binary)
-            # Embed color information on qubits
-            self.pixel_value(color_byte=color_byte)
-            # Remove pixel position embedding
-            self.pixel_position(pixel_pos_binary)
+        self.circuit.h(list(range(self.feature_dim)))
+
+        circuit = self.circuit
+        qubits = circuit.qubits
+
+        # Gate instructions are built once per qubit and shared by every pixel.
+        x_gate = XGate()
+        control_qubits = tuple(qubits[: self.feature_dim])
+        x_instructions = [
+            CircuitInstruction(x_gate, (qubit,), ())
+            for qubit in qubits[: self.feature_dim]
+        ]
+        mcx_instructions = [
+            CircuitInstruction(self._mcx_gate, (*control_qubits, qubit), ())
+            for qubit in qubits[self.feature_dim : self.feature_dim + self.color_qubits]
+        ]
+
+        # The instructions are prevalidated, so they skip the argument
+        # checks of circuit.data and go through Qiskit's _append fast path.
+        gate_table = x_instructions + mcx_instructions
+        for index in self._instruction_plan().tolist():
+            circuit._append(gate_table[index])  # pylint: disable=protected-access
 
         return self.circuit
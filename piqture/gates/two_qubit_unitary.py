@@ -12,6 +12,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from numbers import Real
+
 import numpy as np
 from qiskit.circuit import Parameter, ParameterVector, QuantumCircuit
 
@@ -24,7 +27,7 @@ class TwoQubitUnitary(UnitaryBlock):
     """
 
     @staticmethod
-    def _validate_arguments(
+    def validate_arguments(
         parameter_vector: ParameterVector,
         complex_structure: bool = True,
     ):
@@ -34,9 +37,14 @@ class TwoQubitUnitary(UnitaryBlock):
         #         "Input parameter_vector must be of the type ParameterVector."
         #     )
 
-        if not all(isinstance(vector, Parameter) for vector in parameter_vector):
+        # Plain floats are accepted alongside Parameters so that
+        # numeric blocks skip ParameterExpression arithmetic.
+        if not all(
+            isinstance(vector, (Parameter, Real)) and not isinstance(vector, bool)
+            for vector in parameter_vector
+        ):
             raise TypeError(
-                "Vectors in parameter_vector must be of the type Parameter."
+                "Vectors in parameter_vector must be of the type Parameter or float."
             )
 
         if not isinstance(complex_structure, bool):
@@ -49,7 +57,7 @@ class TwoQubitUnitary(UnitaryBlock):
         parameter_vector: ParameterVector,
         complex_structure: bool = True,
     ) -> tuple[QuantumCircuit, ParameterVector]:
-        self._validate_arguments(
+        self.validate_arguments(
             parameter_vector,
             complex_structure,
         )
@@ -62,7 +70,7 @@ class TwoQubitUnitary(UnitaryBlock):
         parameter_vector: ParameterVector,
         complex_structure: bool = True,
     ) -> tuple[QuantumCircuit, ParameterVector]:
-        self._validate_arguments(
+        self.validate_arguments(
             parameter_vector,
             complex_structure,
         )
@@ -80,6 +88,36 @@ class TwoQubitUnitary(UnitaryBlock):
         with the help of an auxiliary qubit.
         """
 
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _template_block(
+        kind: str, complex_structure: bool = True
+    ) -> tuple[QuantumCircuit, tuple[Parameter, ...]]:
+        """
+        Builds a two-qubit unitary block once on placeholder parameters,
+        which can be instantiated repeatedly with `assign_parameters`.
+        The returned circuit is cached and shared by every caller, so
+        it is kept private and must never be modified in place.
+
+        Args:
+            kind (str): alternative parameterization of the block,
+            either "simple" or "general".
+
+            complex_structure (default=True): boolean marker
+            for real or complex gate parameterization.
+
+        Returns:
+            tuple: template block and its placeholder parameters,
+            in the order in which they are consumed.
+        """
+        if kind not in ("simple", "general"):
+            raise ValueError("Input kind must be either 'simple' or 'general'.")
+
+        placeholders = ParameterVector("template", 15)
+        parameterization = getattr(TwoQubitUnitary(), f"{kind}_parameterization")
+        block, remaining = parameterization(placeholders, complex_structure)
+        return block, tuple(placeholders[: len(placeholders) - len(remaining)])
+
     @staticmethod
     def real_simple_block(
         parameter_vector: ParameterVector,
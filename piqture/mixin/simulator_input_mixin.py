@@ -0,0 +1,60 @@
+# (C) Copyright SaashaJoshi 2024.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Mixin class for exporting circuits to simulators"""
+
+from __future__ import annotations
+
+from qiskit import transpile
+from qiskit.circuit import QuantumCircuit
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import Optimize1qGatesDecomposition
+
+# pylint: disable=too-few-public-methods
+
+
+class SimulatorInputMixin:
+    """
+    A mixin class that prepares structured circuits,
+    held in a `circuit` property, for simulation.
+
+    These circuits are built layer by layer and gain little from
+    Qiskit's automatic optimization passes, which are expensive on
+    large circuits. Prefer this helper, or an equivalent
+    `generate_preset_pass_manager(optimization_level=0)`, over
+    `transpile(circuit)` with `optimization_level >= 1`.
+    """
+
+    basis_gates = ("cx", "u3")
+
+    def to_simulator_input(self, optimize: bool = False) -> QuantumCircuit:
+        """
+        Unrolls the circuit to the CX + U3 basis without
+        running any optimization passes.
+
+        Args:
+            optimize (default=False): boolean marker to merge runs of
+            single-qubit gates, the only optimization that keeps the
+            layered structure of the circuit intact.
+
+        Returns:
+            QuantumCircuit: circuit ready for a simulator backend.
+        """
+        if not isinstance(optimize, bool):
+            raise TypeError("Input optimize must be either True or False (bool).")
+
+        circuit = transpile(
+            self.circuit, basis_gates=list(self.basis_gates), optimization_level=0
+        )
+        if optimize:
+            circuit = PassManager(
+                Optimize1qGatesDecomposition(basis=list(self.basis_gates))
+            ).run(circuit)
+        return circuit
@@ -16,10 +16,12 @@ from abc import ABC
 
 from qiskit.circuit import QuantumCircuit
 
+from piqture.mixin.simulator_input_mixin import SimulatorInputMixin
+
 # pylint: disable=too-few-public-methods
 
 
-class BaseTensorNetwork(ABC):
+class BaseTensorNetwork(ABC, SimulatorInputMixin):
     """Abstract Base Class for Tensor Network Circuits"""
 
     def __init__(self, num_qubits: int):
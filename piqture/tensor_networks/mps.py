@@ -14,7 +14,8 @@ from __future__ import annotations
 
 from typing import Callable
 
-from qiskit.circuit import ParameterVector, QuantumCircuit
+import numpy as np
+from qiskit.circuit import Parameter, ParameterVector, QuantumCircuit
 
 from piqture.gates.two_qubit_unitary import TwoQubitUnitary
 from piqture.tensor_networks.base_tensor_network import BaseTensorNetwork
@@ -52,7 +53,9 @@ class MPS(BaseTensorNetwork):
         """MPS class representation"""
         return f"MatrixProductState(num_qubits={self.num_qubits})"
 
-    def mps_simple(self, complex_structure: bool = True) -> QuantumCircuit:
+    def mps_simple(
+        self, complex_structure: bool = True, symbolic: bool = True
+    ) -> QuantumCircuit:
         """
         Implements an MPS network, as given in [1], with simple
         alternative parameterization.
@@ -61,19 +64,22 @@ class MPS(BaseTensorNetwork):
             complex_structure (default=True): boolean marker
             for real or complex gate parameterization.
 
+            symbolic (default=True): boolean marker for a circuit with
+            unbound Parameters or with random numeric angles. Numeric
+            angles skip Parameter arithmetic entirely, and the circuit can
+            be handed to `transpile(..., optimization_level=0)` as is.
+
         Returns:
             QuantumCircuit: quantum circuit with unitary gates
             represented by simple parameterization.
         """
-        param_vector = ParameterVector("theta", 2 * self.num_qubits - 2)
-        param_vector_copy = param_vector
-        return self.mps_backbone(
-            TwoQubitUnitary().simple_parameterization,
-            param_vector_copy,
-            complex_structure,
-        )
-
-    def mps_general(self, complex_structure: bool = True) -> QuantumCircuit:
+        param_vector = self._parameter_vector(2 * self.num_qubits - 2, symbolic)
+        gate_structure = TwoQubitUnitary().simple_parameterization
+        return self.mps_backbone(gate_structure, param_vector, complex_structure)
+
+    def mps_general(
+        self, complex_structure: bool = True, symbolic: bool = True
+    ) -> QuantumCircuit:
         """
         Implements an MPS network, as given in [1], with general
         alternative parameterization.
@@ -82,23 +88,52 @@ class MPS(BaseTensorNetwork):
             complex_structure (default=True): boolean marker
             for real or complex gate parameterization.
 
+            symbolic (default=True): boolean marker for a circuit with
+            unbound Parameters or with random numeric angles. Numeric
+            angles skip Parameter arithmetic entirely, and the circuit can
+            be handed to `transpile(..., optimization_level=0)` as is.
+
         Returns:
             QuantumCircuit: quantum circuit with unitary gates
             represented by general parameterization.
         """
         # Check number of params here.
         if complex_structure:
-            param_vector = ParameterVector("theta", 15 * self.num_qubits - 2)
-            param_vector_copy = param_vector
+            param_vector = self._parameter_vector(15 * self.num_qubits - 2, symbolic)
         else:
-            param_vector = ParameterVector("theta", 6 * self.num_qubits - 2)
-            param_vector_copy = param_vector
+            param_vector = self._parameter_vector(6 * self.num_qubits - 2, symbolic)
 
-        return self.mps_backbone(
-            TwoQubitUnitary().general_parameterization,
-            param_vector_copy,
-            complex_structure,
-        )
+        gate_structure = TwoQubitUnitary().general_parameterization
+        return self.mps_backbone(gate_structure, param_vector, complex_structure)
+
+    @staticmethod
+    def _parameter_vector(
+        num_params: int, symbolic: bool = True
+    ) -> ParameterVector | list[float]:
+        """
+        Returns a ParameterVector, or a list of random angles
+        when a numeric circuit is requested.
+        """
+        if not isinstance(symbolic, bool):
+            raise TypeError("Input symbolic must be either True or False (bool).")
+
+        if symbolic:
+            return ParameterVector("theta", num_params)
+        return np.random.random(num_params).tolist()
+
+    @staticmethod
+    def _template_kind(gate_structure: Callable) -> str | None:
+        """
+        Returns the kind of TwoQubitUnitary parameterization
+        behind gate_structure, or None for any other callable,
+        including overrides of these methods in subclasses.
+        """
+        function = getattr(gate_structure, "__func__", None)
+        if function is TwoQubitUnitary.simple_parameterization:
+            return "simple"
+        if function is TwoQubitUnitary.general_parameterization:
+            return "general"
+        return None
 
     def mps_with_aux(self, complex_structure: bool = True):
         """
@@ -123,6 +158,8 @@ class MPS(BaseTensorNetwork):
         """
         Lays out the MPS structure by progressively building layers
         of unitary gates with their alternative parameterization.
+        Use `to_simulator_input` to unroll it for a simulator
+        without Qiskit's optimization passes.
 
         Args:
             gate_structure (Callable): a callable function that implements
@@ -139,10 +176,41 @@ class MPS(BaseTensorNetwork):
             QuantumCircuit: quantum circuit with unitary gates
             represented by general parameterization.
         """
-        for index in range(0, self.num_qubits - 1):
-            unitary_block, param_vector_copy = gate_structure(
-                param_vector_copy, complex_structure
+        compose = self.circuit.compose
+        kind = self._template_kind(gate_structure)
+        # Numeric angles are placed directly, a template would
+        # turn them into bound ParameterExpressions.
+        if kind is None or not all(
+            isinstance(param, Parameter) for param in param_vector_copy
+        ):
+            for index in range(self.num_qubits - 1):
+                unitary_block, param_vector_copy = gate_structure(
+                    param_vector_copy, complex_structure
+                )
+                compose(unitary_block, qubits=(index, index + 1), inplace=True)
+        else:
+            # Every block shares one structure, so it is built once
+            # and only its parameters are swapped per qubit pair.
+            TwoQubitUnitary.validate_arguments(param_vector_copy, complex_structure)
+            # pylint: disable=protected-access
+            template, template_params = TwoQubitUnitary._template_block(
+                kind, complex_structure
             )
-            self.circuit.compose(unitary_block, qubits=[index, index + 1], inplace=True)
+            # Parameters are consumed through a cursor into the vector
+            # rather than by re-slicing the shrinking remainder per block.
+            num_params = len(template_params)
+            if len(param_vector_copy) < num_params * (self.num_qubits - 1):
+                raise ValueError(
+                    f"Input param_vector_copy must hold at least "
+                    f"{num_params * (self.num_qubits - 1)} parameters."
+                )
+            offset = 0
+            for index in range(self.num_qubits - 1):
+                block_params = param_vector_copy[offset : offset + num_params]
+                offset += num_params
+                unitary_block = template.assign_parameters(
+                    dict(zip(template_params, block_params)), inplace=False
+                )
+                compose(unitary_block, qubits=(index, index + 1), inplace=True)
 
         return self.circuit
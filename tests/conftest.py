@@ -14,6 +14,7 @@
 import math
 
 import pytest
+from qiskit import qasm2
 from qiskit.circuit import ParameterVector, QuantumCircuit
 
 from piqture.gates.two_qubit_unitary import TwoQubitUnitary
@@ -33,6 +34,20 @@ def circuit_pixel_position_fixture():
     return _circuit
 
 
+@pytest.fixture(name="circuits_equal")
+def circuits_equal_fixture():
+    """
+    Fixture for comparing circuits by their OpenQASM 2 strings, which is
+    cheaper than the DAG comparison behind QuantumCircuit.__eq__.
+    All circuit parameters must be bound.
+    """
+
+    def _circuits_equal(circuit1, circuit2):
+        return qasm2.dumps(circuit1) == qasm2.dumps(circuit2)
+
+    return _circuits_equal
+
+
 @pytest.fixture(name="parameterization_mapper")
 def parameterization_mapper_fixture():
     """Fixture for parameterization mapper dictionary."""
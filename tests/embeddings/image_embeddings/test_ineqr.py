@@ -19,6 +19,7 @@ import numpy as np
 import pytest
 from pytest import raises
 from qiskit.circuit import QuantumCircuit
+from qiskit.quantum_info import Statevector
 
 from piqture.embeddings.image_embeddings.ineqr import INEQR
 
@@ -151,6 +152,7 @@ class TestINEQR:
         mock_circuit = QuantumCircuit(feature_dims + COLOR_QUBITS)
         test_circuit = QuantumCircuit(feature_dims + COLOR_QUBITS)
 
+        pixel_pos = 0
         for _, y_val in enumerate(pixel_vals[0]):
             for _, x_val in enumerate(y_val):
                 mock_circuit.clear()
@@ -167,8 +169,9 @@ class TestINEQR:
                     "piqture.embeddings.image_embeddings.ineqr.INEQR.circuit",
                     new_callable=lambda: mock_circuit,
                 ):
-                    ineqr_object.pixel_value(color_byte=f"{x_val:0>8b}")
+                    ineqr_object.pixel_value(pixel_pos=pixel_pos)
                     assert mock_circuit == test_circuit
+                pixel_pos += 1
 
     @pytest.mark.parametrize(
         "img_dims, pixel_vals, resulting_circuit",
@@ -191,3 +194,35 @@ class TestINEQR:
         ):
             ineqr_object.ineqr()
             assert mock_circuit == resulting_circuit
+
+    @pytest.mark.parametrize(
+        "img_dims, pixel_vals",
+        [((4, 2), [[[128, 64, 1, 2], [0, 0, 0, 1]]])],
+    )
+    def test_ineqr_state(self, img_dims, pixel_vals):
+        """Tests the INEQR state against a pixel by pixel reference encoding."""
+        ineqr_object = INEQR(img_dims, pixel_vals)
+        circuit = ineqr_object.ineqr()
+        assert circuit.count_ops()["mcx"] == 5
+
+        feature_dim = ineqr_object.feature_dim
+        test_circuit = QuantumCircuit(feature_dim + COLOR_QUBITS)
+        test_circuit.h(list(range(feature_dim)))
+        for y_index, y_val in enumerate(pixel_vals[0]):
+            for x_index, x_val in enumerate(y_val):
+                pixel_pos_binary = (
+                    f"{y_index:0>{ineqr_object.y_coord}b}"
+                    f"{x_index:0>{ineqr_object.x_coord}b}"
+                )
+                zero_bits = [
+                    index for index, bit in enumerate(pixel_pos_binary) if bit == "0"
+                ]
+                if zero_bits:
+                    test_circuit.x(zero_bits)
+                for index, bit in enumerate(f"{x_val:0>{COLOR_QUBITS}b}"):
+                    if bit == "1":
+                        test_circuit.mcx(list(range(feature_dim)), feature_dim + index)
+                if zero_bits:
+                    test_circuit.x(zero_bits)
+
+        assert Statevector(circuit).equiv(Statevector(test_circuit))
@@ -12,13 +12,17 @@
 
 from __future__ import annotations
 
+import copy
 import math
+import pickle
+import re
 from unittest import mock
 
 import numpy as np
 import pytest
 from pytest import raises
 from qiskit.circuit import QuantumCircuit
+from qiskit.quantum_info import Operator, Statevector
 
 from piqture.embeddings.image_embeddings.neqr import NEQR
 
@@ -43,6 +47,34 @@ def neqr_pixel_value_fixture():
     return _circuit
 
 
+@pytest.fixture(name="neqr_reference")
+def neqr_reference_fixture():
+    """
+    Fixture for an NEQR circuit built pixel by pixel in row-major
+    order, each pixel setting and undoing its own position embedding.
+    """
+
+    def _circuit(pixel_vals, feature_dim, color_qubits):
+        test_circuit = QuantumCircuit(feature_dim + color_qubits)
+        test_circuit.h(list(range(feature_dim)))
+        for pixel, pixel_val in enumerate(pixel_vals):
+            zero_bits = [
+                index
+                for index, bit in enumerate(f"{pixel:0>{feature_dim}b}")
+                if bit == "0"
+            ]
+            if zero_bits:
+                test_circuit.x(zero_bits)
+            for index, bit in enumerate(f"{int(pixel_val):0>{color_qubits}b}"):
+                if bit == "1":
+                    test_circuit.mcx(list(range(feature_dim)), feature_dim + index)
+            if zero_bits:
+                test_circuit.x(zero_bits)
+        return test_circuit
+
+    return _circuit
+
+
 class TestNEQR:
     """Tests for FRQI image representation class"""
 
@@ -61,6 +93,37 @@ class TestNEQR:
         ):
             _ = NEQR(img_dims, pixel_vals, max_color_intensity)
 
+    @pytest.mark.parametrize(
+        "max_color_intensity, color_qubits",
+        [(0, 1), (1, 1), (3, 2), (4, 3), (127, 7), (128, 8), (255, 8)],
+    )
+    def test_color_qubits(self, max_color_intensity, color_qubits):
+        """Tests the number of qubits encoding the color byte."""
+        neqr_object = NEQR(
+            (2, 2), [[0, 0, max_color_intensity, 0]], max_color_intensity
+        )
+        assert neqr_object.color_qubits == color_qubits
+
+    @pytest.mark.parametrize(
+        "pixel_vals, max_color_intensity",
+        [([[0, 0, 200, 1]], 3), ([list(range(251, 255))], 127)],
+    )
+    def test_pixel_vals_above_max_color_intensity(
+        self, pixel_vals, max_color_intensity
+    ):
+        """Tests that pixel values above max_color_intensity are rejected."""
+        with raises(
+            ValueError,
+            match=r"Pixel values cannot be greater than the maximum color intensity",
+        ):
+            _ = NEQR((2, 2), pixel_vals, max_color_intensity)
+
+    @pytest.mark.parametrize("img_dims, pixel_vals", [((2, 2), None), ((2, 2), [])])
+    def test_symbolic_pixel_vals(self, img_dims, pixel_vals):
+        """Tests that NEQR rejects symbolic pixel values."""
+        with raises(TypeError, match="NEQR requires numeric pixel_vals"):
+            _ = NEQR(img_dims, pixel_vals)
+
     @pytest.mark.parametrize(
         "img_dims, pixel_vals, max_color_intensity",
         [((2, 2), [list(range(251, 255))], MAX_COLOR_INTENSITY)],
@@ -85,7 +148,7 @@ class TestNEQR:
         color_qubits = int(np.ceil(math.log(max_color_intensity, 2)))
         mock_circuit = QuantumCircuit(int(math.prod(img_dims)) + color_qubits)
 
-        for _, pixel_val in enumerate(pixel_vals[0]):
+        for index, pixel_val in enumerate(pixel_vals[0]):
             mock_circuit.clear()
             test_circuit = neqr_pixel_value(img_dims, pixel_val, color_qubits)
 
@@ -93,13 +156,16 @@ class TestNEQR:
                 "piqture.embeddings.image_embeddings.neqr.NEQR.circuit",
                 new_callable=lambda: mock_circuit,
             ):
-                neqr_object.pixel_value(color_byte=f"{pixel_val:0>8b}")
+                neqr_object.pixel_value(pixel_pos=index)
                 assert mock_circuit == test_circuit
 
-    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-arguments, too-many-locals
     @pytest.mark.parametrize(
         "img_dims, pixel_vals, max_color_intensity",
-        [((2, 2), [list(range(1, 5))], MAX_COLOR_INTENSITY)],
+        [
+            ((2, 2), [list(range(1, 5))], MAX_COLOR_INTENSITY),
+            ((4, 4), [list(range(100, 116))], MAX_COLOR_INTENSITY),
+        ],
     )
 
     # pylint: disable=R0917
@@ -110,6 +176,7 @@ class TestNEQR:
         max_color_intensity,
         circuit_pixel_position,
         neqr_pixel_value,
+        neqr_reference,
     ):
         """Tests the final NEQR circuit."""
         neqr_object = NEQR(img_dims, pixel_vals, max_color_intensity)
@@ -117,19 +184,29 @@ class TestNEQR:
         mock_circuit = QuantumCircuit(int(math.prod(img_dims)) + color_qubits)
 
         test_circuit = QuantumCircuit(int(math.prod(img_dims)) + color_qubits)
-        test_circuit.h(list(range(int(np.sqrt(math.prod(img_dims))))))
-        for index, pixel_val in enumerate(pixel_vals[0]):
-            pixel_pos_binary = f"{index:0>2b}"
-            mock_circuit.clear()
-            test_circuit.compose(
-                circuit_pixel_position(img_dims, pixel_pos_binary), inplace=True
+        feature_dim = int(np.sqrt(math.prod(img_dims)))
+        test_circuit.h(list(range(feature_dim)))
+        # Pixels are embedded in Gray-code order, flipping only
+        # the position qubits that differ from the previous pixel.
+        prev_pos_binary = "1" * feature_dim
+        for index in range(len(pixel_vals[0])):
+            pixel = index ^ (index >> 1)
+            pixel_pos_binary = f"{pixel:0>{feature_dim}b}"
+            diff_binary = "".join(
+                "0" if prev != curr else "1"
+                for prev, curr in zip(prev_pos_binary, pixel_pos_binary)
             )
             test_circuit.compose(
-                neqr_pixel_value(img_dims, pixel_val, color_qubits), inplace=True
+                circuit_pixel_position(img_dims, diff_binary), inplace=True
             )
             test_circuit.compose(
-                circuit_pixel_position(img_dims, pixel_pos_binary), inplace=True
+                neqr_pixel_value(img_dims, pixel_vals[0][pixel], color_qubits),
+                inplace=True,
             )
+            prev_pos_binary = pixel_pos_binary
+        test_circuit.compose(
+            circuit_pixel_position(img_dims, prev_pos_binary), inplace=True
+        )
 
         with mock.patch(
             "piqture.embeddings.image_embeddings.neqr.NEQR.circuit",
@@ -137,3 +214,57 @@ class TestNEQR:
         ):
             neqr_object.neqr()
             assert mock_circuit == test_circuit
+
+        # The Gray-code circuit must prepare the same state
+        # as embedding the pixels one by one in row-major order.
+        reference_circuit = neqr_reference(
+            pixel_vals[0], neqr_object.feature_dim, neqr_object.color_qubits
+        )
+        assert Statevector(neqr_object.neqr()).equiv(Statevector(reference_circuit))
+
+    @pytest.mark.parametrize(
+        "img_dims, pixel_vals, max_color_intensity, feature_dim",
+        [
+            ((1, 1), [[3]], 3, 1),
+            ((3, 3), [list(range(9))], 15, 4),
+            ((8, 8), [[pixel % 2 for pixel in range(64)]], 1, 6),
+        ],
+    )
+    # pylint: disable=R0917
+    def test_neqr_position_width(
+        self, img_dims, pixel_vals, max_color_intensity, feature_dim, neqr_reference
+    ):
+        """Tests that every pixel gets a distinct position, also for non-powers of 4."""
+        neqr_object = NEQR(img_dims, pixel_vals, max_color_intensity)
+        assert neqr_object.feature_dim == feature_dim
+
+        test_circuit = neqr_reference(
+            pixel_vals[0], feature_dim, neqr_object.color_qubits
+        )
+        assert Statevector(neqr_object.neqr()).equiv(Statevector(test_circuit))
+
+    @pytest.mark.parametrize(
+        "clone", [copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))]
+    )
+    def test_copy_and_pickle(self, clone):
+        """Tests that NEQR objects can be deep-copied and pickled."""
+        neqr_object = NEQR((2, 2), [[1, 2, 3, 4]])
+        assert clone(neqr_object).neqr() == neqr_object.neqr()
+
+    @pytest.mark.parametrize("optimize", [False, True])
+    def test_to_simulator_input(self, optimize):
+        """Tests the NEQR circuit unrolled for a simulator."""
+        neqr_object = NEQR((2, 2), [list(range(0, 4))], 3)
+        neqr_object.neqr()
+        circuit = neqr_object.to_simulator_input(optimize)
+        assert set(circuit.count_ops()) <= {"cx", "u3"}
+        assert Operator(circuit).equiv(Operator(neqr_object.circuit))
+
+    @pytest.mark.parametrize("optimize", [None, "abc"])
+    def test_type_optimize(self, optimize):
+        """Tests the type of input optimize."""
+        with raises(
+            TypeError,
+            match=re.escape("Input optimize must be either True or False (bool)."),
+        ):
+            _ = NEQR((2, 2), [list(range(1, 5))]).to_simulator_input(optimize)
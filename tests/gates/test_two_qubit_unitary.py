@@ -27,13 +27,13 @@ class TestTwoQubitUnitary:
 
     @pytest.mark.parametrize(
         "parameter_vector, complex_structure",
-        [([23.9, 1.4], False)],
+        [(["abc", 1.4], False), ([True, False], True)],
     )
     def test_validate_vectors(self, parameter_vector, complex_structure):
         """Tests the type of vectors in parameter_vector input."""
         with raises(
             TypeError,
-            match="Vectors in parameter_vector must be of the type Parameter.",
+            match="Vectors in parameter_vector must be of the type Parameter or float.",
         ):
             _ = TwoQubitUnitary().simple_parameterization(
                 parameter_vector, complex_structure
@@ -57,7 +57,7 @@ class TestTwoQubitUnitary:
 
     @pytest.mark.parametrize(
         "parameter_vector, complex_structure",
-        [(ParameterVector("theta", 2), False)],
+        [(ParameterVector("theta", 2), False), ([23.9, 1.4], False)],
     )
     def test_real_simple_parameterization(
         self,
@@ -118,3 +118,30 @@ class TestTwoQubitUnitary:
                 parameter_vector, complex_structure
             )
             mock_complex.assert_called_once_with(parameter_vector)
+
+    @pytest.mark.parametrize(
+        "kind, complex_structure, num_params",
+        [
+            ("simple", False, 2),
+            ("simple", True, 2),
+            ("general", False, 6),
+            ("general", True, 15),
+        ],
+    )
+    def test_template_block(self, kind, complex_structure, num_params):
+        """Tests the cached template block and its placeholder parameters."""
+        # pylint: disable=protected-access
+        block, template_params = TwoQubitUnitary._template_block(
+            kind, complex_structure
+        )
+        assert len(template_params) == num_params
+        assert set(template_params) == set(block.parameters)
+        assert TwoQubitUnitary._template_block(kind, complex_structure)[0] is block
+
+    def test_template_block_kind(self):
+        """Tests the value of input kind."""
+        # pylint: disable=protected-access
+        with raises(
+            ValueError, match="Input kind must be either 'simple' or 'general'."
+        ):
+            _ = TwoQubitUnitary._template_block("auxiliary", True)
@@ -12,11 +12,12 @@
 
 from __future__ import annotations
 
+import re
 from unittest import mock
 
 import pytest
 from pytest import raises
-from qiskit.circuit import QuantumCircuit
+from qiskit.circuit import ParameterVector, QuantumCircuit
 
 from piqture.gates.two_qubit_unitary import TwoQubitUnitary
 from piqture.tensor_networks import MPS
@@ -118,6 +119,78 @@ class TestMPS:
                     general_parameterization, mock.ANY, complex_structure
                 )
 
+    @pytest.mark.parametrize("symbolic", [None, "abc", 1])
+    def test_type_symbolic(self, symbolic):
+        """Tests the type of input symbolic."""
+        with raises(
+            TypeError,
+            match=re.escape("Input symbolic must be either True or False (bool)."),
+        ):
+            _ = MPS(4).mps_simple(symbolic=symbolic)
+
+    @pytest.mark.parametrize(
+        "num_qubits, complex_structure, mps_method",
+        [
+            (4, False, "mps_simple"),
+            (4, True, "mps_simple"),
+            (5, False, "mps_general"),
+            (5, True, "mps_general"),
+        ],
+    )
+    def test_mps_numeric(self, num_qubits, complex_structure, mps_method):
+        """Tests that numeric MPS circuits carry no unbound parameters."""
+        with mock.patch(
+            "piqture.gates.two_qubit_unitary.TwoQubitUnitary._template_block"
+        ) as mock_template_block:
+            circuit = getattr(MPS(num_qubits), mps_method)(complex_structure, False)
+            mock_template_block.assert_not_called()
+        assert circuit.num_parameters == 0
+        assert circuit.count_ops()["cx"] > 0
+
+    @pytest.mark.parametrize(
+        "parameterization, complex_structure, num_params",
+        [("simple", True, 3), ("general", False, 17)],
+    )
+    def test_mps_backbone_short_vector(
+        self, parameterization, complex_structure, num_params
+    ):
+        """Tests that a parameter vector too short for every block is rejected."""
+        gate_structure = getattr(
+            TwoQubitUnitary(), f"{parameterization}_parameterization"
+        )
+        with raises(
+            ValueError,
+            match=r"Input param_vector_copy must hold at least \d+ parameters.",
+        ):
+            _ = MPS(4).mps_backbone(
+                gate_structure, ParameterVector("t", num_params), complex_structure
+            )
+
+    def test_mps_backbone_subclass_override(self):
+        """Tests that an overridden parameterization is not replaced by a template."""
+
+        class ComplexOnlyUnitary(TwoQubitUnitary):
+            """Builds complex simple blocks regardless of complex_structure."""
+
+            def simple_parameterization(self, parameter_vector, complex_structure=True):
+                return self.complex_simple_block(parameter_vector)
+
+        circuit = MPS(4).mps_backbone(
+            ComplexOnlyUnitary().simple_parameterization,
+            ParameterVector("theta", 6),
+            False,
+        )
+        assert circuit.count_ops()["rx"] == 3
+
+    @pytest.mark.parametrize("symbolic, optimize", [(True, False), (False, True)])
+    def test_to_simulator_input(self, symbolic, optimize):
+        """Tests the MPS circuit unrolled for a simulator."""
+        mps = MPS(4)
+        mps.mps_general(False, symbolic)
+        circuit = mps.to_simulator_input(optimize)
+        assert set(circuit.count_ops()) <= {"cx", "u3"}
+        assert circuit.count_ops()["cx"] == mps.circuit.count_ops()["cx"]
+
     @pytest.mark.parametrize(
         "num_qubits, complex_structure, parameterization",
         [